@@ -50,10 +50,10 @@ def main():
     time = 0.
     prev_transitions = [0.] + transitions
     next_transitions = transitions + [0.]
-    for (i, row), t_prev, t_next in zip(timeline.iterrows(), prev_transitions, next_transitions):
-        T = row['duration']
+    for row, t_prev, t_next in zip(timeline.itertuples(), prev_transitions, next_transitions):
+        i, T = row.Index, row.duration
         image = scene.add_layer(
-            mv.layer.Image(row['image'], duration=T + t_prev + t_next), offset=time - t_prev)
+            mv.layer.Image(row.image, duration=T + t_prev + t_next), offset=time - t_prev)
         if i == 0:
             # Add fadein effect
             image.opacity.enable_motion().extend(keyframes=[0.0, 1.0], values=[0.0, 1.0])
@@ -65,10 +65,10 @@ def main():
         kwargs_dict = {
             'center': {'position': (size[0] / 2, size[1] / 2), 'origin_point': mv.Direction.CENTER},
             'bottom_right': {'position': (size[0] - 50, size[1] - 50), 'origin_point': mv.Direction.BOTTOM_RIGHT}}
-        position = kwargs_dict[row['title_position']]['position']
-        origin_point = kwargs_dict[row['title_position']]['origin_point']
+        position = kwargs_dict[row.title_position]['position']
+        origin_point = kwargs_dict[row.title_position]['origin_point']
         scene.add_layer(
-            make_logo(row['title'], duration=T, font_size=64),
+            make_logo(row.title, duration=T, font_size=64),
             offset=time, position=position, origin_point=origin_point)
 
         if 0 < i:
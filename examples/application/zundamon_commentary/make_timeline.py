@@ -1,12 +1,28 @@
+import hashlib
 from pathlib import Path
 
 import pandas as pd
 from movis.contrib.voicevox import make_timeline_from_voicevox, merge_timeline
 
 
+def get_input_digest(audio_dir: Path) -> str:
+    digest = hashlib.blake2b()
+    for txt_file in sorted(audio_dir.glob('*.txt')):
+        stat = txt_file.stat()
+        digest.update(str(txt_file).encode())
+        digest.update(str(stat.st_mtime_ns).encode())
+        digest.update(str(stat.st_size).encode())
+    return digest.hexdigest()
+
+
 def main():
     timeline_path = Path('outputs/timeline.tsv')
+    digest_path = Path('outputs/timeline.tsv.hash')
     Path('outputs').mkdir(exist_ok=True)
+    # Skip the rebuild when no text file has changed since the last run.
+    digest = get_input_digest(Path('audio'))
+    if timeline_path.exists() and digest_path.exists() and digest_path.read_text() == digest:
+        return
     timeline = make_timeline_from_voicevox(
         'audio', extra_columns=(("slide", 0), ("status", "n"), ("section", "")))
     if timeline_path.exists():
@@ -14,6 +30,7 @@ def main():
             pd.read_csv(timeline_path, sep='\t', na_filter=False),
             timeline, key='hash')
     timeline.to_csv('outputs/timeline.tsv', sep='\t', index=False)
+    digest_path.write_text(digest)
 
 
 if __name__ == '__main__':
@@ -32,7 +32,7 @@ def circle_accent_explosion(
 def main():
     timeline = pd.read_csv('outputs/timeline.tsv', sep='\t')
     audio_timeline = make_voicevox_dataframe('audio')
-    tl = pd.merge(timeline, audio_timeline, left_index=True, right_index=True)
+    tl = pd.concat([timeline, audio_timeline], axis=1, join='inner')
     font_name = 'Hiragino Maru Gothic ProN'
 
     scene = mv.layer.Composition(size=(1920, 1080), duration=tl['end_time'].max())
@@ -42,8 +42,8 @@ def main():
     scene.add_layer(
         Slide(
             tl['start_time'], tl['end_time'],
-            slide_file='slide.pdf', slide_counter=np.cumsum(tl['slide'])),
-        position=(960, 421), scale=0.71)
+            slide_file='slide.pdf', slide_counter=np.cumsum(tl['slide']), dpi=142),
+        position=(960, 421))
     scene.add_layer(
         Character(
             tl['start_time'], tl['end_time'],
@@ -121,10 +121,9 @@ def main():
                 offset=start_time),
             np.array([500, 0]))
 
-    for character in tl['character'].unique():
-        character_tl = tl[tl['character'] == character]
+    color_dict = {'zunda': "#5EA638", 'metan': "#AB4A73"}
+    for character, character_tl in tl.groupby('character', sort=False):
         texts = [c.replace('\\n', '\n') for c in character_tl['text'].tolist()]
-        color_dict = {'zunda': "#5EA638", 'metan': "#AB4A73"}
         item = scene.add_layer(
             mv.layer.Text.from_timeline(
                 character_tl['start_time'], character_tl['end_time'], texts,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from os import PathLike
 from pathlib import Path
 from typing import Sequence
@@ -36,6 +37,9 @@ class Slide(TimelineMixin):
             The path to the PDF file containing the slides.
         slide_counter:
             The slide number for each slide. If ``None``, the slide number is automatically assigned.
+        dpi:
+            The resolution used to rasterize the slides. Setting this to the resolution actually shown
+            in the video avoids rendering large images and scaling them down afterwards. Defaults to 200.
 
     Examples:
         >>> from movis.contrib.commentary import Slide
@@ -50,6 +54,7 @@ class Slide(TimelineMixin):
         end_times: Sequence[float],
         slide_file: str | PathLike,
         slide_counter: Sequence[int] | None = None,
+        dpi: int = 200,
     ) -> None:
         if not pdf2image_available:
             raise ImportError("pdf2image is not installed")
@@ -59,6 +64,7 @@ class Slide(TimelineMixin):
         else:
             self.slide_timeline = np.asarray(slide_counter)
         self.slide_file = slide_file
+        self.dpi = dpi
         self.slide_images: list[np.ndarray] | None = None
 
     def get_key(self, time: float) -> int:
@@ -74,7 +80,9 @@ class Slide(TimelineMixin):
         slide_number = self.slide_timeline[idx]
         if self.slide_images is None:
             slide_images = []
-            for img in convert_from_path(Path(self.slide_file)):
+            # Pages are rasterized by parallel poppler processes.
+            thread_count = os.cpu_count() or 1
+            for img in convert_from_path(Path(self.slide_file), dpi=self.dpi, thread_count=thread_count):
                 img_np = np.asarray(img.convert("RGBA"))
                 slide_images.append(img_np)
             self.slide_images = slide_images
@@ -169,6 +177,7 @@ class Character(TimelineMixin):
 
         self.blink_per_minute = blink_per_minute
         self.blink_duration = blink_duration
+        self._random_state = np.random.RandomState()
 
     def _get_eye_state(self, time: float, idx: int) -> int:
 
@@ -176,7 +185,8 @@ class Character(TimelineMixin):
             string = f"{seed}:{string}"
             s = hashlib.sha224(f"{seed}:{string}".encode("utf-8")).digest()
             x = np.frombuffer(s, dtype=np.uint32)[0]
-            return np.random.RandomState(x).rand()
+            self._random_state.seed(x)
+            return self._random_state.rand()
 
         emotion = self.character_timeline[idx]
         if emotion not in self.eye_imgs:
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import difflib
 import hashlib
+import os
+import wave
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Hashable
@@ -15,6 +18,43 @@ except ImportError:
     pandas_available = False
 
 
+_CHARACTER_DICT = {
+    "ずんだもん": "zunda",
+    "四国めたん": "metan",
+    "春日部つむぎ": "tsumugi",
+}
+
+
+@lru_cache(maxsize=1024)
+def _get_audio_length_cached(path: str, mtime_ns: int, size: int) -> float:
+    # Only the RIFF header is parsed for PCM wav files; other formats fall back to librosa.
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() / float(w.getframerate())
+    except (wave.Error, EOFError):
+        return librosa.get_duration(path=path)
+
+
+def _get_audio_length(filename: str | PathLike) -> float:
+    # The cache key is the absolute path with the modification time and size,
+    # so that edited files are measured again.
+    stat = os.stat(filename)
+    return _get_audio_length_cached(os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_paths(src_dir: str | PathLike, ext: str) -> list[Path]:
+    src_dir = Path(src_dir)
+    with os.scandir(src_dir) as it:
+        names = sorted(e.name for e in it if e.name.endswith(ext) and e.is_file())
+    return [src_dir / name for name in names]
+
+
+def _get_hash_prefix(text: str) -> str:
+    # NOTE: The prefix is stored in user timelines and compared by ``merge_timeline``,
+    # so the hash function must not change.
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:6]
+
+
 def make_voicevox_dataframe(audio_dir: str | PathLike) -> "DataFrame":
     """Create a ``pandas.DataFrame`` representing the timeline of audio files generated by Voicevox.
 
@@ -48,14 +88,11 @@ def make_voicevox_dataframe(audio_dir: str | PathLike) -> "DataFrame":
     if not pandas_available:
         raise ImportError("pandas is not installed")
 
-    def get_audio_length(filename: str | PathLike) -> float:
-        return librosa.get_duration(path=filename)
-
-    wav_files = sorted(f for f in Path(audio_dir).iterdir() if f.suffix == ".wav")
+    wav_files = _get_paths(audio_dir, ".wav")
     rows = []
     start_time = 0.0
     for wav_file in wav_files:
-        duration = get_audio_length(wav_file)
+        duration = _get_audio_length(wav_file)
         end_time = start_time + duration
         dic = {
             "start_time": start_time,
@@ -126,38 +163,22 @@ def make_timeline_from_voicevox(
     if not pandas_available:
         raise ImportError("pandas is not installed")
 
-    def get_paths(src_dir: Path, ext: str) -> list[Path]:
-        src_dir = Path(src_dir)
-        return sorted(f for f in src_dir.iterdir() if f.suffix == ext)
-
-    def get_hash_prefix(text):
-        text_bytes = text.encode("utf-8")
-        sha1_hash = hashlib.sha1(text_bytes)
-        hashed_text = sha1_hash.hexdigest()
-        prefix = hashed_text[:6]
-        return prefix
-
-    txt_files = get_paths(Path(audio_dir), ".txt")
+    txt_files = _get_paths(audio_dir, ".txt")
     lines = []
     for txt_file in txt_files:
-        raw_text = open(txt_file, "r", encoding="utf-8-sig").read()
+        raw_text = txt_file.read_text(encoding="utf-8-sig")
         if raw_text == "":
             raise RuntimeError(
                 f"Empty text file: {txt_file}. Please remove it and try again."
             )
-        character_dict = {
-            "ずんだもん": "zunda",
-            "四国めたん": "metan",
-            "春日部つむぎ": "tsumugi",
-        }
         character = txt_file.stem.split("_")[1].split("（")[0]
         text = "\\n".join([
             raw_text[i: i + max_text_length]
             for i in range(0, len(raw_text), max_text_length)]
         )
-        dic = {
-            "character": character_dict[character],
-            "hash": get_hash_prefix(raw_text),
+        dic: dict[str, Hashable] = {
+            "character": _CHARACTER_DICT[character],
+            "hash": _get_hash_prefix(raw_text),
             "text": text,
         }
         for column_name, default_value in extra_columns:
@@ -208,23 +229,28 @@ def merge_timeline(
 
     differ = difflib.Differ()
     diff = differ.compare(old_timeline[key].to_list(), new_timeline[key].tolist())
-    result = []
+    old_rows = old_timeline.to_dict("records")
+    new_rows = new_timeline.to_dict("records")
     old_indices = old_timeline.index.tolist()
     new_indices = new_timeline.index.tolist()
+    result, index = [], []
     old_idx, new_idx = 0, 0
     for d in diff:
         if d.startswith("-"):
-            row = old_timeline.iloc[old_indices[old_idx]].copy()
+            row = dict(old_rows[old_idx])
             row[description] = f"<<<<< {row[description]}"
             result.append(row)
+            index.append(old_indices[old_idx])
             old_idx += 1
         elif d.startswith("+"):
-            row = new_timeline.iloc[new_indices[new_idx]].copy()
+            row = dict(new_rows[new_idx])
             row[description] = f">>>>> {row[description]}"
             result.append(row)
+            index.append(new_indices[new_idx])
             new_idx += 1
         else:
-            result.append(old_timeline.iloc[old_indices[old_idx]])
+            result.append(old_rows[old_idx])
+            index.append(old_indices[old_idx])
             old_idx += 1
             new_idx += 1
-    return DataFrame(result)
+    return DataFrame(result, index=index)
@@ -1,4 +1,15 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from types import MappingProxyType
+
+
+class _TagEnum(IntEnum):
+    # ``IntEnum`` prints bare integers on Python 3.11+; keep the ``Enum`` output in messages and reprs.
+
+    def __str__(self) -> str:
+        return Enum.__str__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
 
 class CacheType(Enum):
@@ -7,7 +18,7 @@ class CacheType(Enum):
     LAYER = 1
 
 
-class AttributeType(Enum):
+class AttributeType(_TagEnum):
     """A type used to determine the type and dimension of an attribute."""
     SCALAR = 0
     VECTOR2D = 1
@@ -30,7 +41,7 @@ class AttributeType(Enum):
             raise ValueError(f"Unknown attribute type: {s}")
 
 
-class Easing(Enum):
+class Easing(_TagEnum):
     """Constants for determining the completion function between keyframes.
 
     Constants:
@@ -104,13 +115,13 @@ class Easing(Enum):
     @staticmethod
     def from_string(s: str) -> "Easing":
         """Convert a string to a motion type."""
-        if s in STRING_TO_EASING:
+        try:
             return STRING_TO_EASING[s]
-        else:
-            raise ValueError(f"Unknown motion type: {s}")
+        except KeyError:
+            raise ValueError(f"Unknown motion type: {s}") from None
 
 
-STRING_TO_EASING = {
+STRING_TO_EASING = MappingProxyType({
     "linear": Easing.LINEAR,
     "ease_in": Easing.EASE_IN,
     "ease_out": Easing.EASE_OUT,
@@ -167,11 +178,16 @@ STRING_TO_EASING = {
     "ease_in_out25": Easing.EASE_IN_OUT25,
     "ease_in_out30": Easing.EASE_IN_OUT30,
     "ease_in_out35": Easing.EASE_IN_OUT35,
-}
+})
+
 
+class BlendingMode(_TagEnum):
+    """Constants for determining the blending mode when compositing layers.
 
-class BlendingMode(Enum):
-    """Constants for determining the blending mode when compositing layers."""
+    .. note::
+        Members are integers, so they compare equal to plain ``int`` values (``BlendingMode.NORMAL == 0``)
+        and to members of other enums in this module with the same value (``BlendingMode.NORMAL == MatteMode.NONE``).
+    """
     NORMAL = 0
     MULTIPLY = 1
     SCREEN = 2
@@ -194,10 +210,10 @@ class BlendingMode(Enum):
     @staticmethod
     def from_string(s: str) -> "BlendingMode":
         """Convert a string to a blending mode."""
-        if s in STRING_TO_BLENDING_MODE:
+        try:
             return STRING_TO_BLENDING_MODE[s]
-        else:
-            raise ValueError(f"Unknown blending mode: {s}")
+        except KeyError:
+            raise ValueError(f"Unknown blending mode: {s}") from None
 
 
 STRING_TO_BLENDING_MODE = {
@@ -222,7 +238,7 @@ STRING_TO_BLENDING_MODE = {
 }
 
 
-class MatteMode(Enum):
+class MatteMode(_TagEnum):
     """Constants for determining the matte mode when compositing layers."""
     NONE = 0
     ALPHA = 1
@@ -230,10 +246,10 @@ class MatteMode(Enum):
 
     @staticmethod
     def from_string(s: str) -> "MatteMode":
-        if s in STRING_TO_MATTE_MODE:
+        try:
             return STRING_TO_MATTE_MODE[s]
-        else:
-            raise ValueError(f"Unknown matte mode: {s}")
+        except KeyError:
+            raise ValueError(f"Unknown matte mode: {s}") from None
 
 
 STRING_TO_MATTE_MODE = {
@@ -243,8 +259,13 @@ STRING_TO_MATTE_MODE = {
 }
 
 
-class Direction(Enum):
-    """Constants for determining the origin point of a layer."""
+class Direction(_TagEnum):
+    """Constants for determining the origin point of a layer.
+
+    .. note::
+        Members are integers, so they compare equal to plain ``int`` values (``Direction.BOTTOM_LEFT == 1``)
+        and to members of other enums in this module with the same value (``Direction.BOTTOM_LEFT == Easing.EASE_IN``).
+    """
     BOTTOM_LEFT = 1
     BOTTOM_CENTER = 2
     BOTTOM_RIGHT = 3
@@ -258,34 +279,18 @@ class Direction(Enum):
     @staticmethod
     def from_string(s: str) -> "Direction":
         """Convert a string to a direction."""
-        if s in STRING_TO_DIRECTION:
+        try:
             return STRING_TO_DIRECTION[s]
-        else:
-            raise ValueError(f"Unknown origin point: {s}")
+        except KeyError:
+            raise ValueError(f"Unknown origin point: {s}") from None
 
     @staticmethod
     def to_vector(d: "Direction", size: tuple[float, float]) -> tuple[float, float]:
         """Convert a direction to a vector."""
-        if d == Direction.BOTTOM_LEFT:
-            return (0, size[1])
-        elif d == Direction.BOTTOM_CENTER:
-            return (size[0] / 2, size[1])
-        elif d == Direction.BOTTOM_RIGHT:
-            return (size[0], size[1])
-        elif d == Direction.CENTER_LEFT:
-            return (0, size[1] / 2)
-        elif d == Direction.CENTER:
-            return (size[0] / 2, size[1] / 2)
-        elif d == Direction.CENTER_RIGHT:
-            return (size[0], size[1] / 2)
-        elif d == Direction.TOP_LEFT:
-            return (0, 0)
-        elif d == Direction.TOP_CENTER:
-            return (size[0] / 2, 0)
-        elif d == Direction.TOP_RIGHT:
-            return (size[0], 0)
-        else:
+        if not isinstance(d, Direction):
             raise ValueError(f"Unknown direction: {d}")
+        fx, fy = _DIRECTION_FACTORS[d.value - 1]
+        return (size[0] * fx, size[1] * fy)
 
 
 STRING_TO_DIRECTION = {
@@ -300,8 +305,15 @@ STRING_TO_DIRECTION = {
     "top_right": Direction.TOP_RIGHT,
 }
 
+# Factors of the size for each direction, indexed by ``Direction - 1``.
+_DIRECTION_FACTORS: tuple[tuple[float, float], ...] = (
+    (0.0, 1.0), (0.5, 1.0), (1.0, 1.0),
+    (0.0, 0.5), (0.5, 0.5), (1.0, 0.5),
+    (0.0, 0.0), (0.5, 0.0), (1.0, 0.0),
+)
+
 
-class TextAlignment(Enum):
+class TextAlignment(_TagEnum):
     """Constants for determining the alignment of text."""
     LEFT = 0
     CENTER = 1
@@ -310,10 +322,10 @@ class TextAlignment(Enum):
     @staticmethod
     def from_string(s: str) -> "TextAlignment":
         """Convert a string to a text alignment."""
-        if s in STRING_TO_TEXT_ALIGNMENT:
+        try:
             return STRING_TO_TEXT_ALIGNMENT[s]
-        else:
-            raise ValueError(f"Unknown text alignment: {s}")
+        except KeyError:
+            raise ValueError(f"Unknown text alignment: {s}") from None
 
 
 STRING_TO_TEXT_ALIGNMENT = {
@@ -321,3 +333,11 @@ STRING_TO_TEXT_ALIGNMENT = {
     "center": TextAlignment.CENTER,
     "right": TextAlignment.RIGHT,
 }
+
+# Direct string lookups for hot loops, bypassing the ``from_string`` call.
+# Unlike ``from_string``, these raise ``KeyError`` for unknown strings.
+parse_easing = STRING_TO_EASING.__getitem__
+parse_blending_mode = STRING_TO_BLENDING_MODE.__getitem__
+parse_matte_mode = STRING_TO_MATTE_MODE.__getitem__
+parse_direction = STRING_TO_DIRECTION.__getitem__
+parse_text_alignment = STRING_TO_TEXT_ALIGNMENT.__getitem__
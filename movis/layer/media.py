@@ -400,13 +400,13 @@ class Audio:
         audio = self._load_audio()
         start_index = int(start_time * AUDIO_SAMPLING_RATE)
         end_index = int(end_time * AUDIO_SAMPLING_RATE)
-        if start_index < 0:
-            audio = np.pad(audio, ((0, 0), (-start_index, 0)))
-            end_index = end_index - start_index
-            start_index = 0
-        if end_index > audio.shape[1]:
-            audio = np.pad(audio, ((0, 0), (0, end_index - audio.shape[1])))
-        return audio[:, start_index:end_index]
+        # Only the part of the requested range outside the audio data is zero-padded.
+        chunk = audio[:, max(0, start_index):max(0, min(end_index, audio.shape[1]))]
+        pad_left = min(max(0, -start_index), end_index - start_index)
+        pad_right = end_index - start_index - pad_left - chunk.shape[1]
+        if pad_left > 0 or pad_right > 0:
+            chunk = np.pad(chunk, ((0, 0), (pad_left, pad_right)))
+        return chunk
 
 
 class AudioSequence:
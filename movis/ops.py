@@ -116,9 +116,14 @@ class _RepeatLayer:
         return self.layer.get_key(t)
 
     def get_audio(self, start_time: float, end_time: float) -> np.ndarray | None:
+        # Only the repetitions overlapping [start_time, end_time) contribute to the audio. One extra
+        # repetition on each side is kept since sample indices are truncated at the boundaries.
+        d = self.layer.duration
+        i_start = max(int(np.floor(start_time / d)) - 1, 0)
+        i_end = min(int(np.ceil(end_time / d)) + 1, self.n_repeat)
         c = Composition(size=(8, 8), duration=self.duration)
-        for i in range(self.n_repeat):
-            c.add_layer(self.layer, offset=i * self.layer.duration)
+        for i in range(i_start, i_end):
+            c.add_layer(self.layer, offset=i * d)
         return c.get_audio(start_time, end_time)
 
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 from os import PathLike
 from typing import NamedTuple, Sequence
 
+import numpy as np
+
 from .enum import Direction
 from .util import to_rgb
 
@@ -52,16 +54,26 @@ def rgb_to_ass_color(color: str | tuple[int, int, int] | Sequence[int]) -> str:
         >>> mv.rgb_to_ass_color('blue')
         '&Hff0000'
     """
-    rgb_array = to_rgb(color)
-    return "&H{:02x}{:02x}{:02x}".format(rgb_array[2], rgb_array[1], rgb_array[0])
+    r, g, b = to_rgb(color)
+    return "&H%06x" % (b << 16 | g << 8 | r)
+
+
+def _split_times(
+        times: Sequence[float], subsecond_scale: int) -> tuple[list[int], list[int], list[int], list[int]]:
+    """Split times in seconds into hours, minutes, seconds and ``1 / subsecond_scale`` fractions of a second."""
+    t = np.asarray(times, dtype=np.float64)
+    hours = (t / 3600).astype(np.int64)
+    minutes = ((t / 60) % 60).astype(np.int64)
+    seconds = (t % 60).astype(np.int64)
+    fractions = ((t % 1) * subsecond_scale).astype(np.int64)
+    return hours.tolist(), minutes.tolist(), seconds.tolist(), fractions.tolist()
 
 
-def _make_ass_style_header():
-    format_str = "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, " \
-        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, " \
-        "ScaleX, ScaleY, Spacing, Angle, BorderStyle, " \
-        "Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding"
-    return '\n'.join(["[V4+ Styles]", format_str])
+_ASS_STYLE_HEADER = "[V4+ Styles]\n" \
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, " \
+    "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, " \
+    "ScaleX, ScaleY, Spacing, Angle, BorderStyle, " \
+    "Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding"
 
 
 def _make_ass_style(s: ASSStyleType):
@@ -126,7 +138,6 @@ def write_ass_file(
     if styles is None:
         styles = [ASSStyleType()]
 
-    ass_style_header = _make_ass_style_header()
     ass_style_body = '\n'.join([_make_ass_style(style) for style in styles])
 
     header = f"""[Script Info]
@@ -137,28 +148,22 @@ PlayResY: {size[1]}
 ScaledBorderAndShadow: yes
 YCbCr Matrix: None
 
-{ass_style_header}
+{_ASS_STYLE_HEADER}
 {ass_style_body}
 
 [Events]
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
-    line_template = "Dialogue: 0,{start_time},{end_time},{character},,0,0,0,,{text}"
-
-    def get_time(t):
-        return "{:02d}:{:02d}:{:02d}.{:02d}".format(
-            int(t / 3600), int((t / 60) % 60), int(t % 60), int((t % 1) * 100)
-        )
-
-    lines = []
-    for t0, t1, character, text in zip(start_times, end_times, characters, texts):
-        text0, text1 = get_time(t0), get_time(t1)
-        x = line_template.format(
-            start_time=text0, end_time=text1, character=character, text=text)
-        lines.append(x)
-    body = "\n".join(lines)
+
+    def get_times(times):
+        return ["{:02d}:{:02d}:{:02d}.{:02d}".format(*x) for x in zip(*_split_times(times, 100))]
+
+    body = "\n".join(
+        f"Dialogue: 0,{t0},{t1},{character},,0,0,0,,{text}"
+        for t0, t1, character, text in zip(get_times(start_times), get_times(end_times), characters, texts))
     with open(dst_ass_file, "w") as fp:
-        fp.write(header + body)
+        fp.write(header)
+        fp.write(body)
 
 
 def write_srt_file(
@@ -178,14 +183,11 @@ def write_srt_file(
             The destination path for the generated SRT file.
     """
     assert len(start_times) == len(end_times) == len(texts)
+    start_hms = zip(*_split_times(start_times, 1000))
+    end_hms = zip(*_split_times(end_times, 1000))
     with open(dst_srt_file, 'w') as srt:
-        for i, (start_time, end_time, text) in enumerate(zip(start_times, end_times, texts)):
+        for i, (t0, t1, text) in enumerate(zip(start_hms, end_hms, texts)):
             srt.write('{}\n'.format(i + 1))
-            srt.write('{:02d}:{:02d}:{:02d},{:03d} --> {:02d}:{:02d}:{:02d},{:03d}\n'.format(
-                int(start_time / 3600), int((start_time / 60) % 60),
-                int(start_time % 60), int((start_time % 1) * 1000),
-                int(end_time / 3600), int((end_time / 60) % 60),
-                int(end_time % 60), int((end_time % 1) * 1000),
-            ))
+            srt.write('{:02d}:{:02d}:{:02d},{:03d} --> {:02d}:{:02d}:{:02d},{:03d}\n'.format(*t0, *t1))
             cleaned_text = text.replace(r"\n", "").replace("\n", "")
             srt.write(cleaned_text + '\n\n')
@@ -272,3 +272,20 @@ def test_composition_get_coords():
     coords = item.get_composition_coords(
         time=0.0, layer_coords=np.array([[0, 0], [32, 16]], dtype=float))
     assert np.all(coords == np.array([[8, 4], [24, 12]], dtype=float))
+
+
+def test_composition_get_audio():
+    scene = Composition(size=(64, 64), duration=2.0)
+    audio = np.full((2, mv.AUDIO_SAMPLING_RATE), 0.5, dtype=np.float32)
+    scene.add_layer(mv.layer.Audio(audio))
+    item = scene.add_layer(mv.layer.Audio(audio), offset=1.0)
+    item.audio_level.set(-20.0)
+
+    _, _, audio_i = item._get_audio_data(0.0, 2.0)
+    assert audio_i.dtype == np.float32
+
+    x = scene.get_audio(0.0, 2.0)
+    assert x.dtype == np.float32
+    assert x.shape == (2, 2 * mv.AUDIO_SAMPLING_RATE)
+    assert np.allclose(x[:, :mv.AUDIO_SAMPLING_RATE], 0.5)
+    assert np.allclose(x[:, mv.AUDIO_SAMPLING_RATE:], 0.05)
@@ -0,0 +1,75 @@
+import pytest
+
+from movis.enum import (STRING_TO_BLENDING_MODE, STRING_TO_DIRECTION,
+                        STRING_TO_EASING, STRING_TO_MATTE_MODE,
+                        STRING_TO_TEXT_ALIGNMENT, BlendingMode, Direction,
+                        Easing, MatteMode, TextAlignment, parse_blending_mode,
+                        parse_direction, parse_easing, parse_matte_mode,
+                        parse_text_alignment)
+
+enum_params = [
+    (Easing, STRING_TO_EASING),
+    (BlendingMode, STRING_TO_BLENDING_MODE),
+    (MatteMode, STRING_TO_MATTE_MODE),
+    (Direction, STRING_TO_DIRECTION),
+    (TextAlignment, STRING_TO_TEXT_ALIGNMENT),
+]
+
+parse_params = [
+    (parse_easing, STRING_TO_EASING),
+    (parse_blending_mode, STRING_TO_BLENDING_MODE),
+    (parse_matte_mode, STRING_TO_MATTE_MODE),
+    (parse_direction, STRING_TO_DIRECTION),
+    (parse_text_alignment, STRING_TO_TEXT_ALIGNMENT),
+]
+
+
+@pytest.mark.parametrize("enum_type, table", enum_params)
+def test_from_string(enum_type, table):
+    for key, value in table.items():
+        assert enum_type.from_string(key) is value
+    assert len(set(table.values())) == len(enum_type)
+
+
+@pytest.mark.parametrize("enum_type, table", enum_params)
+def test_from_string_unknown(enum_type, table):
+    with pytest.raises(ValueError):
+        enum_type.from_string("unknown")
+
+
+@pytest.mark.parametrize("parse, table", parse_params)
+def test_parse(parse, table):
+    for key, value in table.items():
+        assert parse(key) is value
+    with pytest.raises(KeyError):
+        parse("unknown")
+
+
+@pytest.mark.parametrize("direction, expected", [
+    (Direction.BOTTOM_LEFT, (0, 20)),
+    (Direction.BOTTOM_CENTER, (5, 20)),
+    (Direction.BOTTOM_RIGHT, (10, 20)),
+    (Direction.CENTER_LEFT, (0, 10)),
+    (Direction.CENTER, (5, 10)),
+    (Direction.CENTER_RIGHT, (10, 10)),
+    (Direction.TOP_LEFT, (0, 0)),
+    (Direction.TOP_CENTER, (5, 0)),
+    (Direction.TOP_RIGHT, (10, 0)),
+])
+def test_direction_to_vector(direction, expected):
+    assert Direction.to_vector(direction, (10.0, 20.0)) == expected
+
+
+@pytest.mark.parametrize("direction", [0, 10, 5, "center"])
+def test_direction_to_vector_unknown(direction):
+    with pytest.raises(ValueError):
+        Direction.to_vector(direction, (10.0, 20.0))
+
+
+@pytest.mark.parametrize("enum_type, table", enum_params)
+def test_str_format(enum_type, table):
+    for value in enum_type:
+        name = f"{enum_type.__name__}.{value.name}"
+        assert str(value) == name
+        assert f"{value}" == name
+        assert format(value, ">40") == f"{name:>40}"
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import movis as mv
 
@@ -174,3 +175,19 @@ def test_fade_in_out():
     assert np.all(scene(1.0)[0, 0, :] == np.array([255, 255, 255, 255]))
     assert np.all(scene(2.0)[0, 0, :] == np.array([255, 255, 255, 255]))
     assert np.all(scene(4.0 - 1e-5)[0, 0, :] == np.array([0, 0, 0, 255]))
+
+
+@pytest.mark.parametrize("n_samples", [4410, 2566])
+def test_repeat_get_audio(n_samples):
+    audio = np.random.rand(2, n_samples).astype(np.float32)
+    layer = mv.layer.Audio(audio)
+    scene = mv.repeat(layer, 5)
+    ref = mv.layer.Composition(size=(8, 8), duration=scene.duration)
+    for i in range(5):
+        ref.add_layer(layer, offset=i * layer.duration)
+    d = layer.duration
+    windows = [(0.0, 5 * d), (0.12, 0.24), (0.2, 0.25), (4.5 * d, 5 * d)]
+    windows += [(i * d, i * d + 0.0115) for i in range(1, 5)]
+    for start_time, end_time in windows:
+        np.testing.assert_array_equal(
+            scene.get_audio(start_time, end_time), ref.get_audio(start_time, end_time))
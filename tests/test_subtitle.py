@@ -0,0 +1,29 @@
+import movis as mv
+
+
+def test_write_srt_file(tmp_path):
+    dst = tmp_path / "subtitle.srt"
+    mv.write_srt_file([0.0, 59.5, 3723.25], [1.0, 61.0, 3725.0], ["a", "b\\nc", "d"], dst)
+    assert dst.read_text() == (
+        "1\n00:00:00,000 --> 00:00:01,000\na\n\n"
+        "2\n00:00:59,500 --> 00:01:01,000\nbc\n\n"
+        "3\n01:02:03,250 --> 01:02:05,000\nd\n\n")
+
+
+def test_write_ass_file(tmp_path):
+    dst = tmp_path / "subtitle.ass"
+    mv.write_ass_file(
+        [0.0, 3723.25], [1.5, 3725.0], ["a", "b"], dst, size=(640, 480),
+        characters=["Alice", "Bob"],
+        styles=[mv.ASSStyleType(name="Alice"), mv.ASSStyleType(name="Bob")])
+    lines = dst.read_text().splitlines()
+    assert "PlayResX: 640" in lines
+    assert "PlayResY: 480" in lines
+    assert lines[-2] == "Dialogue: 0,00:00:00.00,00:00:01.50,Alice,,0,0,0,,a"
+    assert lines[-1] == "Dialogue: 0,01:02:03.25,01:02:05.00,Bob,,0,0,0,,b"
+
+
+def test_rgb_to_ass_color():
+    assert mv.rgb_to_ass_color((255, 0, 0)) == "&H0000ff"
+    assert mv.rgb_to_ass_color((1, 2, 3)) == "&H030201"
+    assert mv.rgb_to_ass_color("blue") == "&Hff0000"